@@ -0,0 +1,283 @@
+import os
+import csv
+import json
+
+from collections import Counter
+from datetime import datetime
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from multiprocessing import Pool
+
+from typing import (
+    Self,
+    Optional,
+    Iterator
+)
+
+from .fair import HOUSE_EDGE
+
+# Bet histories are CSV exports or JSON-lines journals with one bet per
+# row. Only amount and payout are required. session, rule_set, game,
+# currency, payout_multiplier, chance (or target and condition, or
+# multiplier_target) and updated_at are used when present.
+
+@dataclass
+class Summary:
+    bets         : int=0
+    wins         : int=0
+    expected_wins: float=0.0
+    wagered      : float=0.0
+    payout       : float=0.0
+
+    @property
+    def profit(self: Self) -> float:
+        return self.payout - self.wagered
+
+    @property
+    def win_rate(self: Self) -> float:
+        return self.wins / self.bets if self.bets else 0.0
+
+    @property
+    def expected_win_rate(self: Self) -> float:
+        return self.expected_wins / self.bets if self.bets else 0.0
+
+    @property
+    def rtp(self: Self) -> float:
+        return self.payout / self.wagered if self.wagered else 0.0
+
+    def add(
+        self: Self,
+        win: bool,
+        expected_win: float,
+        amount: float,
+        payout: float
+    ) -> None:
+        self.bets          += 1
+        self.wins          += win
+        self.expected_wins += expected_win
+        self.wagered       += amount
+        self.payout        += payout
+
+    def merge(
+        self: Self,
+        other: Self
+    ) -> None:
+        self.bets          += other.bets
+        self.wins          += other.wins
+        self.expected_wins += other.expected_wins
+        self.wagered       += other.wagered
+        self.payout        += other.payout
+
+@dataclass
+class Streaks:
+    # Runs are (win, length). Only the first and last run of a chunk can
+    # continue into a neighbouring chunk; everything between them is
+    # complete and counted in middle.
+    first : Optional[tuple[bool, int] | None]=None
+    last  : Optional[tuple[bool, int] | None]=None
+    middle: Counter=field(default_factory=Counter)
+
+    def add(
+        self: Self,
+        win: bool
+    ) -> None:
+        match self.first, self.last:
+            case None, _:
+                self.first = (win, 1)
+            case (state, length), None if state == win:
+                self.first = (win, length + 1)
+            case _, None:
+                self.last = (win, 1)
+            case _, (state, length) if state == win:
+                self.last = (win, length + 1)
+            case _, run:
+                self.middle[run] += 1
+                self.last = (win, 1)
+
+    def merge(
+        self: Self,
+        other: Self
+    ) -> None:
+        if other.first is None:
+            return
+        if self.first is None:
+            self.first, self.last, self.middle = other.first, other.last, Counter(other.middle)
+            return
+
+        left  = [run for run in (self.first, self.last) if run]
+        right = [run for run in (other.first, other.last) if run]
+        if left[-1][0] == right[0][0]:
+            right[0] = (right[0][0], left.pop()[1] + right[0][1])
+
+        runs        = left + right
+        self.middle = self.middle + other.middle + Counter(runs[1:-1])
+        self.first  = runs[0]
+        self.last   = runs[-1] if len(runs) > 1 else None
+
+    def distribution(self: Self) -> Counter:
+        return self.middle + Counter(run for run in (self.first, self.last) if run)
+
+@dataclass
+class Report:
+    sessions  : dict[str, Summary]=field(default_factory=dict)
+    rule_sets : dict[str, Summary]=field(default_factory=dict)
+    rtp       : dict[tuple[str, str], Summary]=field(default_factory=dict)
+    streaks   : dict[str, Streaks]=field(default_factory=dict)
+    profit    : dict[str, Counter]=field(default_factory=dict)
+    throughput: Counter=field(default_factory=Counter)
+
+    def merge(
+        self: Self,
+        other: Self
+    ) -> None:
+        for mine, theirs in (
+            (self.sessions, other.sessions),
+            (self.rule_sets, other.rule_sets),
+            (self.rtp, other.rtp),
+            (self.streaks, other.streaks)
+        ):
+            for key, value in theirs.items():
+                if key in mine:
+                    mine[key].merge(value)
+                else:
+                    mine[key] = value
+        for key, value in other.profit.items():
+            self.profit.setdefault(key, Counter()).update(value)
+        self.throughput.update(other.throughput)
+
+    def profit_curve(
+        self: Self,
+        session: str
+    ) -> list[tuple[int, float]]:
+        curve  = []
+        profit = 0.0
+        for bucket, delta in sorted(self.profit[session].items()):
+            profit += delta
+            curve.append((bucket, profit))
+        return curve
+
+def parse_timestamp(value: str) -> float | None:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return parsedate_to_datetime(value).timestamp()
+
+def expected_win(row: dict[str, str]) -> float:
+    match row:
+        case {'chance': chance} if chance:
+            return float(chance) / 100
+        case {'multiplier_target': multiplier_target} if multiplier_target:
+            return (1 - HOUSE_EDGE) / float(multiplier_target)
+        case {'target': target, 'condition': condition} if target and condition:
+            chance = float(target) if str(condition).lower() == 'below' else 100 - float(target)
+            return chance / 100
+        case _:
+            return 0.0
+
+def _rows(
+    path: str,
+    start: int,
+    stop: int,
+    fieldnames: list[str] | None
+) -> Iterator[dict[str, str]]:
+    with open(path, 'rb') as file_handler:
+        # Step back one byte and drop the rest of that line, it belongs to
+        # the previous range unless start is already a line boundary.
+        if start:
+            file_handler.seek(start - 1)
+            file_handler.readline()
+        while file_handler.tell() <= stop:
+            line = file_handler.readline()
+            if not line:
+                break
+            line = line.decode().strip()
+            if not line:
+                continue
+            if fieldnames is None:
+                yield json.loads(line)
+            else:
+                yield dict(zip(fieldnames, next(csv.reader([line]))))
+
+def aggregate_range(
+    path: str,
+    start: int,
+    stop: int,
+    fieldnames: list[str] | None,
+    bucket_seconds: int
+) -> Report:
+    report = Report()
+    for row in _rows(path, start, stop, fieldnames):
+        session  = str(row.get('session') or '')
+        rule_set = str(row.get('rule_set') or '')
+        amount   = float(row['amount'])
+        payout   = float(row['payout'])
+        win      = (
+            float(row['payout_multiplier']) > 1
+            if row.get('payout_multiplier')
+            else
+            payout > amount
+        )
+        expected = expected_win(row)
+
+        for summaries, key in (
+            (report.sessions, session),
+            (report.rule_sets, rule_set),
+            (report.rtp, (str(row.get('game') or ''), str(row.get('currency') or '')))
+        ):
+            if key not in summaries:
+                summaries[key] = Summary()
+            summaries[key].add(win, expected, amount, payout)
+
+        if session not in report.streaks:
+            report.streaks[session] = Streaks()
+        report.streaks[session].add(win)
+
+        timestamp = parse_timestamp(row.get('updated_at') or '')
+        if timestamp is not None:
+            bucket = int(timestamp // bucket_seconds * bucket_seconds)
+            report.throughput[bucket] += 1
+            report.profit.setdefault(session, Counter())[bucket] += payout - amount
+
+    return report
+
+def _aggregate_range(args: tuple) -> Report:
+    return aggregate_range(*args)
+
+def analyze(
+    path: str,
+    processes: Optional[int | None]=None,
+    chunk_bytes: Optional[int]=64 << 20,
+    bucket_seconds: Optional[int]=60
+) -> Report:
+    with open(path, 'rb') as file_handler:
+        first_line = file_handler.readline()
+        header_end = file_handler.tell()
+
+    if path.endswith('.csv'):
+        fieldnames = next(csv.reader([first_line.decode()]))
+        start      = header_end
+    else:
+        fieldnames = None
+        start      = 0
+
+    # A worker owns every line that starts inside its byte range, so
+    # ranges can be cut anywhere and merged back in file order.
+    size   = os.path.getsize(path)
+    ranges = [
+        (path, offset, min(offset + chunk_bytes, size) - 1, fieldnames, bucket_seconds)
+        for offset in range(start, size, chunk_bytes)
+    ]
+
+    # imap hands partials back one at a time and in order, so at most a
+    # few unmerged ranges are held here instead of one per chunk.
+    report = Report()
+    with Pool(processes) as pool:
+        for partial in pool.imap(_aggregate_range, ranges, chunksize=1):
+            report.merge(partial)
+    return report
@@ -0,0 +1,78 @@
+import threading
+import traceback
+
+from typing import (
+    Self,
+    Optional
+)
+
+from .client import Client
+from .events import Event, EventBus
+from .models import (
+    Balance,
+    Currency
+)
+
+CURRENCIES = {currency.value: currency for currency in Currency}
+
+class BalanceCache:
+    def __init__(
+        self: Self,
+        client: Client,
+        interval: Optional[float]=1.0
+    ) -> None:
+        self._client   = client
+        self._interval = interval
+        self._balances = {}
+        self.events    = EventBus()
+        self._stop     = threading.Event()
+        self._thread   = None
+
+    def refresh(self: Self) -> dict[Currency, Balance]:
+        # Swap the whole dict so readers never see a half-built index. Real
+        # accounts hold many currencies Currency does not list, skip those.
+        self._balances = {
+            CURRENCIES[currency]: balance
+            for balance in self._client.get_user_balances()
+            if (currency := balance.available.currency) in CURRENCIES
+        }
+        self.events.emit(Event.BALANCE_RECONCILED, self._balances)
+        return self._balances
+
+    def get(
+        self: Self,
+        currency: Currency
+    ) -> Balance:
+        balances = self._balances or self.refresh()
+        return balances[currency]
+
+    def available(
+        self: Self,
+        currency: Currency
+    ) -> float:
+        return self.get(currency).available.amount
+
+    def _poll(self: Self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self.refresh()
+            except Exception:
+                traceback.print_exc()
+
+    def start(self: Self) -> Self:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self: Self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self: Self) -> Self:
+        return self.start()
+
+    def __exit__(self: Self, *exc_info) -> None:
+        self.stop()
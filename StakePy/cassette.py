@@ -0,0 +1,114 @@
+import json
+import gzip
+import time
+import threading
+
+import requests
+
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+
+from typing import (
+    Self,
+    Optional
+)
+
+from .errors import CassetteExhaustedError, CassetteMismatchError
+
+# A cassette is JSON lines, gzipped when the name ends in .gz. Each line
+# is one _get_json_response call: the GraphQL payload sent, the status
+# and raw body received (or the transport error raised) and how long the
+# server took, so malformed bodies and resets replay exactly as recorded.
+
+def _open(
+    path: str,
+    mode: str
+):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+class CassetteRecorder:
+    def __init__(
+        self: Self,
+        path: str
+    ) -> None:
+        self.path           = path
+        self._file_handler  = _open(path, 'wt')
+        self._lock          = threading.Lock()
+
+    def record(
+        self: Self,
+        json_data: dict[str, str],
+        duration: float,
+        response: Optional[requests.Response | None]=None,
+        error: Optional[Exception | None]=None
+    ) -> None:
+        entry = dict(request=json_data, duration=round(duration, 6))
+        if error is not None:
+            entry['error'] = str(error)
+        else:
+            entry['status']       = response.status_code
+            entry['content_type'] = response.headers.get('content-type', '')
+            entry['body']         = response.text
+
+        line = json.dumps(entry, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._file_handler.write(line)
+
+    def close(self: Self) -> None:
+        with self._lock:
+            self._file_handler.close()
+
+class CassetteAdapter(BaseAdapter):
+    def __init__(
+        self: Self,
+        path: str,
+        realtime: Optional[bool]=False
+    ) -> None:
+        super().__init__()
+        # Parsed up front so replay itself adds as little as possible to the
+        # per-bet time being measured.
+        with _open(path, 'rt') as file_handler:
+            self._entries = [json.loads(line) for line in file_handler if line.strip()]
+        self._realtime = realtime
+        self._position = 0
+        self._lock     = threading.Lock()
+
+    def __len__(self: Self) -> int:
+        return len(self._entries)
+
+    @property
+    def remaining(self: Self) -> int:
+        return len(self._entries) - self._position
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            if self._position >= len(self._entries):
+                raise CassetteExhaustedError(f'All {len(self._entries)} recorded responses were played.')
+            entry = self._entries[self._position]
+            # Checked before advancing so a mismatch leaves the entry in place.
+            if json.loads(request.body)['query'] != entry['request']['query']:
+                raise CassetteMismatchError(
+                    f'Request {self._position + 1} does not match the recorded operation.'
+                )
+            self._position += 1
+
+        if self._realtime:
+            time.sleep(entry['duration'])
+
+        if 'error' in entry:
+            raise ConnectionError(entry['error'], request=request)
+
+        response             = requests.Response()
+        response.status_code = entry['status']
+        response.headers     = CaseInsensitiveDict({'content-type': entry['content_type']})
+        response.encoding    = 'utf-8'
+        response._content    = entry['body'].encode('utf-8')
+        response.url         = request.url
+        response.request     = request
+        return response
+
+    def close(self):
+        pass
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import os
+import ssl
 import time
+import types
+import threading
 import requests
 from tenacity import (
     retry,
     wait_exponential,
+    wait_none,
     retry_if_exception_type,
     stop_after_attempt
 )
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, JSONDecodeError
 from rich import print
 from dotenv import load_dotenv
 from typing import Self, Optional, Callable
 from .errors import InsufficientBalanceError, InsignificantBetError
+from .cassette import CassetteRecorder, CassetteAdapter
 from .models import (
     Game,
     User,
@@ -25,7 +31,8 @@ from .models import (
     QUERIES,
     Balance,
     Available,
-    Vault
+    Vault,
+    ConnectionHealth
 )
 
 retry_predicates = (
@@ -43,6 +50,71 @@ API_ERROR_TYPES = {
     'insignificantBet': InsignificantBetError
 }
 
+class SessionKeepingSSLSocket(ssl.SSLSocket):
+    # The session dies with the socket, and urllib3 discards dropped
+    # connections before opening new ones, so save it on the way out.
+    def _real_close(self):
+        if self._sslobj is not None:
+            self.context.remember_session(self)
+        super()._real_close()
+
+class ResumingSSLContext(ssl.SSLContext):
+    # Hands the last TLS session to every new connection so a reconnect
+    # resumes it instead of doing a full handshake.
+    sslsocket_class = SessionKeepingSSLSocket
+
+    def __new__(cls, protocol=ssl.PROTOCOL_TLS_CLIENT, *args, **kwargs):
+        return super().__new__(cls, protocol, *args, **kwargs)
+
+    def __init__(self, protocol=ssl.PROTOCOL_TLS_CLIENT):
+        self.tls_session = None
+        self._lock       = threading.Lock()
+        # urllib3 matches hostnames itself and needs this off to apply verify=False.
+        self.check_hostname = False
+
+    def remember_session(self, sock):
+        # Only called with a socket the calling thread owns. Reading a
+        # session OpenSSL is still building fails in i2d with ValueError,
+        # and losing one capture is harmless, so never let it escape.
+        try:
+            session = sock.session
+        except (ValueError, OSError):
+            return
+        if session is not None:
+            with self._lock:
+                self.tls_session = session
+
+    def wrap_socket(self, *args, **kwargs):
+        with self._lock:
+            session = self.tls_session
+        if session is not None:
+            kwargs.setdefault('session', session)
+        return super().wrap_socket(*args, **kwargs)
+
+class KeepAliveAdapter(HTTPAdapter):
+    def __init__(self, ssl_context=None, **kwargs):
+        self.ssl_context = ResumingSSLContext() if ssl_context is None else ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def remember_session(self, response, **kwargs):
+        # Response hook: the connection that served this response is still
+        # checked out, so no other thread is reading or handshaking on it.
+        # TLS 1.3 tickets arrive after the handshake, and an idle socket
+        # may be dropped before the next connect, so grab the session now.
+        connection = getattr(response.raw, 'connection', None)
+        sock       = getattr(connection, 'sock', None)
+        if isinstance(sock, ssl.SSLSocket) and sock.context is self.ssl_context:
+            self.ssl_context.remember_session(sock)
+        return response
+
+    def reconnect(self):
+        # Closing the pooled sockets saves their sessions on the way out.
+        self.poolmanager.clear()
+
 class Client:
     STAKE_API_URL = 'https://stake.krd/_api/graphql'
 
@@ -51,16 +123,27 @@ class Client:
         api_key: str,
         cf_clearance: str,
         cf_bm: str,
-        cfuvid: str
+        cfuvid: str,
+        api_url: Optional[str | None]=None
     ) -> None:
-        self._session = requests.Session()
-        self._headers = {
+        if api_url:
+            self.STAKE_API_URL = api_url
+        self.health     = ConnectionHealth()
+        self._adapter   = KeepAliveAdapter()
+        self._keepalive = None
+        self._recorder  = None
+        self._cassette  = None
+        self._session   = requests.Session()
+        self._session.mount('https://', self._adapter)
+        self._session.mount('http://', self._adapter)
+        self._headers   = {
             'content-type': 'application/json',
             'user-agent': 'Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Mobile Safari/537.36',
             'cookie': f'cf_clearance={cf_clearance}; __cf_bm={cf_bm}; _cfuvid={cfuvid}',
             'x-access-token': api_key
         }
         self._session.headers.update(self._headers)
+        self._session.hooks['response'].append(self._adapter.remember_session)
 
     def _get_enum(
         self: Self,
@@ -89,9 +172,138 @@ class Client:
         self: Self,
         json_data: dict[str, str]
     ) -> dict[str, str]:
-        response = self._session.post(self.STAKE_API_URL, json=json_data)
+        if self._recorder is None:
+            return self._post(json_data).json()
+
+        started = time.monotonic()
+        try:
+            response = self._post(json_data)
+        except ConnectionError as error:
+            self._recorder.record(json_data, time.monotonic() - started, error=error)
+            raise
+        self._recorder.record(json_data, time.monotonic() - started, response=response)
         return response.json()
 
+    def record(
+        self: Self,
+        path: str
+    ) -> None:
+        self.stop_recording()
+        self._recorder = CassetteRecorder(path)
+
+    def stop_recording(self: Self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+            self._recorder = None
+
+    def replay(
+        self: Self,
+        path: str,
+        realtime: Optional[bool]=False
+    ) -> CassetteAdapter:
+        # Keepalive pings were never recorded and would eat replay entries.
+        self.stop_keepalive()
+        adapter        = CassetteAdapter(path, realtime)
+        self._cassette = adapter
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        if not realtime:
+            # Recorded errors still go through the retry path, just without
+            # the backoff sleeps, which would swamp the per-bet timings.
+            self._get_json_response = types.MethodType(
+                Client._get_json_response.retry_with(wait=wait_none()),
+                self
+            )
+        return adapter
+
+    def _post(
+        self: Self,
+        json_data: dict[str, str]
+    ) -> requests.Response:
+        health              = self.health
+        health.requests    += 1
+        health.last_request = time.monotonic()
+        try:
+            response = self._session.post(self.STAKE_API_URL, json=json_data)
+        except ConnectionError:
+            health.failures             += 1
+            health.consecutive_failures += 1
+            self.reconnect()
+            raise
+
+        health.last_success         = time.monotonic()
+        health.last_latency         = health.last_success - health.last_request
+        health.average_latency      = (
+            0.9 * health.average_latency + 0.1 * health.last_latency
+            if health.average_latency
+            else
+            health.last_latency
+        )
+        health.consecutive_failures = 0
+        return response
+
+    def reconnect(self: Self) -> None:
+        # Drop every pooled connection, the TLS session survives in the
+        # adapter's SSL context.
+        self.health.reconnects += 1
+        self._adapter.reconnect()
+
+    def warmup(
+        self: Self,
+        connections: Optional[int]=1
+    ) -> None:
+        json_data = dict(
+            query=QUERIES['user_balances'],
+            operationName='UserBalances'
+        )
+        # Concurrent requests so the pool ends up with that many open sockets.
+        threads = [
+            threading.Thread(target=self._get_json_response, args=(json_data,))
+            for _ in range(connections)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _ping_when_idle(
+        self: Self,
+        interval: float,
+        stop: threading.Event
+    ) -> None:
+        json_data = dict(
+            query=QUERIES['user_balances'],
+            operationName='UserBalances'
+        )
+        while not stop.wait(interval / 2):
+            last_request = self.health.last_request
+            if last_request is not None and time.monotonic() - last_request < interval:
+                continue
+            try:
+                self._post(json_data)
+            except ConnectionError:
+                pass
+
+    def start_keepalive(
+        self: Self,
+        interval: Optional[float]=15.0
+    ) -> None:
+        self.stop_keepalive()
+        if self._cassette is not None:
+            # Pings bypass the recorder, so a replayed session has none.
+            return
+        stop            = threading.Event()
+        thread          = threading.Thread(target=self._ping_when_idle, args=(interval, stop), daemon=True)
+        self._keepalive = (thread, stop)
+        thread.start()
+
+    def stop_keepalive(self: Self) -> None:
+        if self._keepalive is not None:
+            thread, stop = self._keepalive
+            stop.set()
+            thread.join()
+            self._keepalive = None
+
     def _get_data(self, json_response) -> dict[str, str]:
         match json_response:
             case {'errors': [
@@ -178,9 +390,24 @@ class Client:
                 'STAKE_CF_BM': CF_BM,
                 'STAKE_CFUVID': CFUVID
             }:
-                return Client(API_KEY, CF_CLEARANCE, CF_BM, CFUVID)
+                return Client(
+                    API_KEY,
+                    CF_CLEARANCE,
+                    CF_BM,
+                    CFUVID,
+                    os.environ.get('STAKE_API_URL')
+                )
             case _: raise KeyError()
 
+    @staticmethod
+    def from_cassette(
+        path: str,
+        realtime: Optional[bool]=False
+    ) -> Client:
+        client = Client('', '', '', '')
+        client.replay(path, realtime)
+        return client
+
     def get_user_balances(self: Self) -> dict[str, str]:
         json_data = dict(
             query=QUERIES['user_balances'],
@@ -2,4 +2,10 @@ class InsufficientBalanceError(Exception):
     pass
 
 class InsignificantBetError(Exception):
+    pass
+
+class CassetteExhaustedError(Exception):
+    pass
+
+class CassetteMismatchError(Exception):
     pass
\ No newline at end of file
@@ -0,0 +1,129 @@
+import time
+import queue
+import threading
+import traceback
+
+from enum import StrEnum, auto
+from typing import (
+    Self,
+    Any,
+    Callable,
+    Optional
+)
+
+class Event(StrEnum):
+    BET_SUBMITTED      = auto()
+    BET_SETTLED        = auto()
+    RULE_FIRED         = auto()
+    BALANCE_RECONCILED = auto()
+    ERROR              = auto()
+
+_STOP = object()
+
+class Threaded:
+    def __init__(
+        self: Self,
+        listener: Callable[[Any], None]
+    ) -> None:
+        self._listener = listener
+        self._queue    = queue.SimpleQueue()
+        self._thread   = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def __call__(
+        self: Self,
+        payload: Any
+    ) -> None:
+        self._queue.put(payload)
+
+    def _worker(self: Self) -> None:
+        while (payload := self._queue.get()) is not _STOP:
+            try:
+                self._listener(payload)
+            except Exception:
+                traceback.print_exc()
+
+    def close(self: Self) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+
+class Batched(Threaded):
+    def __init__(
+        self: Self,
+        listener: Callable[[list[Any]], None],
+        size: Optional[int]=100,
+        interval: Optional[float]=1.0
+    ) -> None:
+        self._size     = size
+        self._interval = interval
+        super().__init__(listener)
+
+    def _worker(self: Self) -> None:
+        batch    = []
+        deadline = time.monotonic() + self._interval
+        stopped  = False
+
+        while not stopped:
+            try:
+                payload = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                payload = None
+            else:
+                if payload is _STOP:
+                    stopped = True
+                else:
+                    batch.append(payload)
+
+            if batch and (stopped or len(batch) >= self._size or time.monotonic() >= deadline):
+                try:
+                    self._listener(batch)
+                except Exception:
+                    traceback.print_exc()
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self._interval
+
+class EventBus:
+    def __init__(self: Self) -> None:
+        self._listeners = {event: () for event in Event}
+
+    def subscribe(
+        self: Self,
+        event: Event,
+        listener: Callable[[Any], None]
+    ) -> Callable[[Any], None]:
+        self._listeners[event] += (listener,)
+        return listener
+
+    def unsubscribe(
+        self: Self,
+        event: Event,
+        listener: Callable[[Any], None]
+    ) -> None:
+        self._listeners[event] = tuple(
+            subscribed
+            for subscribed in self._listeners[event]
+            if subscribed is not listener
+        )
+
+    def has_listeners(
+        self: Self,
+        event: Event
+    ) -> bool:
+        return bool(self._listeners[event])
+
+    def emit(
+        self: Self,
+        event: Event,
+        payload: Any
+    ) -> None:
+        for listener in self._listeners[event]:
+            listener(payload)
+
+    def close(self: Self) -> None:
+        for listeners in self._listeners.values():
+            for listener in listeners:
+                if isinstance(listener, Threaded):
+                    listener.close()
+        self._listeners = {event: () for event in Event}
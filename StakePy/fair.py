@@ -0,0 +1,58 @@
+import hmac
+import hashlib
+
+from .models import DiceTargetCondition
+
+HOUSE_EDGE = 0.01
+
+def get_float(
+    server_seed: str,
+    client_seed: str,
+    nonce: int,
+    cursor: int=0
+) -> float:
+    digest = hmac.new(
+        server_seed.encode(),
+        f'{client_seed}:{nonce}:{cursor // 32}'.encode(),
+        hashlib.sha256
+    ).digest()
+    offset = cursor % 32
+    return sum(
+        byte / (256 ** (i + 1))
+        for i, byte in enumerate(digest[offset:offset + 4])
+    )
+
+def dice_target(
+    chance: float,
+    dice_target_condition: DiceTargetCondition
+) -> float:
+    return chance if dice_target_condition == DiceTargetCondition.BELOW else 100 - chance
+
+def dice_result(
+    server_seed: str,
+    client_seed: str,
+    nonce: int
+) -> float:
+    return int(get_float(server_seed, client_seed, nonce) * 10001) / 100
+
+def limbo_result(
+    server_seed: str,
+    client_seed: str,
+    nonce: int
+) -> float:
+    float_point = 1e8 / max(get_float(server_seed, client_seed, nonce) * 1e8, 1) * (1 - HOUSE_EDGE)
+    return max(int(float_point * 100) / 100, 1.0)
+
+def dice_win(
+    result: float,
+    target: float,
+    dice_target_condition: DiceTargetCondition
+) -> bool:
+    match dice_target_condition:
+        case DiceTargetCondition.ABOVE:
+            return result > target
+        case DiceTargetCondition.BELOW:
+            return result < target
+
+def dice_payout_multiplier(chance: float) -> float:
+    return (100 - HOUSE_EDGE * 100) / chance
@@ -0,0 +1,79 @@
+from array import array
+from typing import (
+    Self,
+    Iterator,
+    Optional
+)
+
+from .models import BetInfo
+
+class RecentBets:
+    # Fixed-capacity ring buffer stored as one preallocated array per
+    # column, so appending a bet overwrites slots instead of allocating.
+    def __init__(
+        self: Self,
+        capacity: Optional[int]=10
+    ) -> None:
+        self.capacity            = capacity
+        self.count               = 0
+        self.window_wins         = 0
+        self.streak_win          = None
+        self.streak              = 0
+        self.longest_win_streak  = 0
+        self.longest_loss_streak = 0
+        self._numbers            = array('Q', bytes(8 * capacity))
+        self._ids                = [None] * capacity
+        self._payout_multipliers = array('d', bytes(8 * capacity))
+        self._amounts            = array('d', bytes(8 * capacity))
+        self._payouts            = array('d', bytes(8 * capacity))
+        self._wins               = array('B', bytes(capacity))
+
+    def __len__(self: Self) -> int:
+        return min(self.count, self.capacity)
+
+    @property
+    def window_losses(self: Self) -> int:
+        return len(self) - self.window_wins
+
+    def append(
+        self: Self,
+        bet_info: BetInfo
+    ) -> None:
+        slot = self.count % self.capacity
+        win  = bet_info.win
+
+        if self.count >= self.capacity:
+            self.window_wins -= self._wins[slot]
+        self.window_wins += win
+
+        self.count                    += 1
+        self._numbers[slot]            = self.count
+        self._ids[slot]                = bet_info.id
+        self._payout_multipliers[slot] = bet_info.payout_multiplier
+        self._amounts[slot]            = bet_info.amount
+        self._payouts[slot]            = bet_info.payout
+        self._wins[slot]               = win
+
+        if win == self.streak_win:
+            self.streak += 1
+        else:
+            self.streak_win = win
+            self.streak     = 1
+
+        if win:
+            self.longest_win_streak  = max(self.longest_win_streak, self.streak)
+        else:
+            self.longest_loss_streak = max(self.longest_loss_streak, self.streak)
+
+    def rows(self: Self) -> Iterator[tuple[int, str, float, float, float, bool]]:
+        size = len(self)
+        for offset in range(self.count - size, self.count):
+            slot = offset % self.capacity
+            yield (
+                self._numbers[slot],
+                self._ids[slot],
+                self._payout_multipliers[slot],
+                self._amounts[slot],
+                self._payouts[slot],
+                bool(self._wins[slot])
+            )
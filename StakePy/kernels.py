@@ -0,0 +1,129 @@
+import hmac
+import hashlib
+
+import numpy as np
+
+from typing import Optional
+
+from .fair import HOUSE_EDGE
+from .models import (
+    Game,
+    BetInfo,
+    DiceState,
+    DiceTargetCondition
+)
+
+# Batched counterparts of the scalar helpers in fair.py. Every function
+# takes scalars or arrays and broadcasts, nothing here loops in Python
+# except seed_floats, since HMAC itself cannot be vectorized.
+
+_BYTE_WEIGHTS = 1 / 256.0 ** np.arange(1, 5)
+
+def seed_floats(
+    server_seed: str,
+    client_seed: str,
+    start: int,
+    stop: int
+) -> np.ndarray:
+    key    = server_seed.encode()
+    digest = b''.join(
+        hmac.new(key, f'{client_seed}:{nonce}:0'.encode(), hashlib.sha256).digest()[:4]
+        for nonce in range(start, stop)
+    )
+    return np.frombuffer(digest, dtype=np.uint8).reshape(-1, 4) @ _BYTE_WEIGHTS
+
+def dice_results(floats: np.ndarray) -> np.ndarray:
+    return np.floor(np.asarray(floats) * 10001) / 100
+
+def limbo_results(floats: np.ndarray) -> np.ndarray:
+    float_point = 1e8 / np.maximum(np.asarray(floats) * 1e8, 1) * (1 - HOUSE_EDGE)
+    return np.maximum(np.floor(float_point * 100) / 100, 1.0)
+
+def is_below(dice_target_condition) -> np.ndarray:
+    # Encode the condition once into a mask and hand that to the helpers
+    # below. Boolean masks pass through untouched, a scalar is one compare.
+    condition = np.asarray(dice_target_condition)
+    if condition.dtype == np.bool_:
+        return condition
+    if condition.ndim == 0:
+        return np.bool_(str(condition.item()) == DiceTargetCondition.BELOW.value)
+    return condition.astype(str, copy=False) == DiceTargetCondition.BELOW.value
+
+def dice_targets(
+    chance: np.ndarray,
+    below: np.ndarray
+) -> np.ndarray:
+    # Same conversion as Client.dice_roll.
+    chance = np.asarray(chance, dtype=np.float64)
+    return np.where(below, chance, 100 - chance)
+
+def dice_chances(
+    target: np.ndarray,
+    below: np.ndarray
+) -> np.ndarray:
+    target = np.asarray(target, dtype=np.float64)
+    return np.where(below, target, 100 - target)
+
+def dice_multipliers(chance: np.ndarray) -> np.ndarray:
+    return (100 - HOUSE_EDGE * 100) / np.asarray(chance, dtype=np.float64)
+
+def dice_wins(
+    results: np.ndarray,
+    targets: np.ndarray,
+    below: np.ndarray
+) -> np.ndarray:
+    results = np.asarray(results, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64)
+    return np.where(below, results < targets, results > targets)
+
+def dice_payouts(
+    amount: np.ndarray,
+    chance: np.ndarray,
+    dice_target_condition,
+    results: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    below = is_below(dice_target_condition)
+    wins  = dice_wins(results, dice_targets(chance, below), below)
+    payout_multiplier = np.where(wins, dice_multipliers(chance), 0.0)
+    return payout_multiplier, np.asarray(amount, dtype=np.float64) * payout_multiplier
+
+def limbo_payouts(
+    amount: np.ndarray,
+    multiplier_target: np.ndarray,
+    results: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    multiplier_target = np.asarray(multiplier_target, dtype=np.float64)
+    payout_multiplier = np.where(np.asarray(results) >= multiplier_target, multiplier_target, 0.0)
+    return payout_multiplier, np.asarray(amount, dtype=np.float64) * payout_multiplier
+
+def expected_payout_multipliers(bets: list[BetInfo]) -> np.ndarray:
+    is_dice = np.array([bet.game == Game.DICE for bet in bets], dtype=bool)
+    results = np.array([bet.state.result for bet in bets], dtype=np.float64)
+    target  = np.array([
+        bet.state.target if isinstance(bet.state, DiceState) else bet.state.multiplier_target
+        for bet in bets
+    ], dtype=np.float64)
+    below   = np.array([
+        isinstance(bet.state, DiceState) and bet.state.dice_target_condition == DiceTargetCondition.BELOW
+        for bet in bets
+    ], dtype=bool)
+    # Settle against the recorded target, a target -> chance -> target
+    # round trip can move it off a result that landed exactly on it.
+    dice_multiplier     = np.where(
+        dice_wins(results, target, below),
+        dice_multipliers(dice_chances(target, below)),
+        0.0
+    )
+    limbo_multiplier, _ = limbo_payouts(1.0, target, results)
+    return np.where(is_dice, dice_multiplier, limbo_multiplier)
+
+def validate(
+    bets: list[BetInfo],
+    rtol: Optional[float]=1e-4
+) -> np.ndarray:
+    # The API rounds multipliers for display, so compare with a tolerance.
+    # Returns a mask of bets whose payout_multiplier disagrees with the kernel.
+    if not bets:
+        return np.zeros(0, dtype=bool)
+    actual = np.array([bet.payout_multiplier for bet in bets], dtype=np.float64)
+    return ~np.isclose(actual, expected_payout_multipliers(bets), rtol=rtol)
@@ -195,6 +195,24 @@ class Statistics:
     profit : float
     wagered: float
 
+@dataclass
+class ConnectionHealth:
+    requests            : int=0
+    failures            : int=0
+    consecutive_failures: int=0
+    reconnects          : int=0
+    last_latency        : float=0.0
+    average_latency     : float=0.0
+    last_request        : Optional[float | None]=None
+    last_success        : Optional[float | None]=None
+
+@dataclass
+class SessionStatistics:
+    balance     : float
+    bets        : int
+    max_drawdown: float
+    peak_bet    : float
+
 @dataclass
 class DiceModifiers:
     base_bet: float
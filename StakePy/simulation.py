@@ -0,0 +1,238 @@
+import copy
+import hashlib
+
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from typing import (
+    Self,
+    Optional,
+    Sequence
+)
+
+from .fair import (
+    dice_result,
+    dice_target,
+    dice_win,
+    dice_payout_multiplier
+)
+from .models import (
+    Game,
+    BetInfo,
+    DiceState,
+    DiceModifiers,
+    SessionStatistics
+)
+
+class SessionResults:
+    # One float64 column per field, laid out back to back, so every
+    # session costs a fixed 8 * len(FIELDS) bytes and workers write
+    # straight into the block instead of pickling results back.
+    FIELDS = ('balance', 'bets', 'max_drawdown', 'peak_bet')
+
+    def __init__(
+        self: Self,
+        n_sessions: int,
+        name: Optional[str]=None
+    ) -> None:
+        self.n_sessions = n_sessions
+        self._owner     = name is None
+        self._shm       = SharedMemory(
+            name=name,
+            create=self._owner,
+            size=max(n_sessions * len(self.FIELDS) * 8, 8)
+        )
+        self._buffer    = self._shm.buf.cast('d')
+
+    def __len__(self: Self) -> int:
+        return self.n_sessions
+
+    def __getitem__(
+        self: Self,
+        index: int
+    ) -> SessionStatistics:
+        n = self.n_sessions
+        # Columns share one buffer, an unchecked index reads the next column.
+        if not 0 <= index < n:
+            raise IndexError(f'session index {index} out of range for {n} sessions')
+        return SessionStatistics(
+            balance=self._buffer[index],
+            bets=int(self._buffer[n + index]),
+            max_drawdown=self._buffer[2 * n + index],
+            peak_bet=self._buffer[3 * n + index]
+        )
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def name(self: Self) -> str:
+        return self._shm.name
+
+    def write(
+        self: Self,
+        index: int,
+        balance: float,
+        bets: int,
+        max_drawdown: float,
+        peak_bet: float
+    ) -> None:
+        n = self.n_sessions
+        self._buffer[index]         = balance
+        self._buffer[n + index]     = bets
+        self._buffer[2 * n + index] = max_drawdown
+        self._buffer[3 * n + index] = peak_bet
+
+    def column(
+        self: Self,
+        field: str
+    ) -> memoryview:
+        # Zero-copy view, release it before calling close().
+        offset = self.FIELDS.index(field) * self.n_sessions
+        return self._buffer[offset:offset + self.n_sessions]
+
+    def close(self: Self) -> None:
+        self._buffer.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+def session_seed(
+    seed: str,
+    index: int
+) -> str:
+    return hashlib.sha256(f'{seed}:{index}'.encode()).hexdigest()
+
+def simulate_session(
+    modifiers: DiceModifiers,
+    rules: list,
+    balance: float,
+    server_seed: str,
+    client_seed: str,
+    max_bets: int,
+    results: Optional[Sequence[int] | None]=None
+) -> tuple[float, int, float, float]:
+    modifiers    = copy.deepcopy(modifiers)
+    rules        = copy.deepcopy(rules)
+    peak_balance = balance
+    max_drawdown = 0.0
+    peak_bet     = 0.0
+    bets         = 0
+
+    if results is not None:
+        max_bets = min(max_bets, len(results))
+
+    for nonce in range(max_bets):
+        amount = modifiers.bet_amount
+        if amount > balance:
+            break
+
+        chance    = modifiers.chance
+        condition = modifiers.dice_target_condition
+        target    = dice_target(chance, condition)
+        result    = (
+            # Precomputed streams (see SeedStreamCache.dice) hold hundredths.
+            results[nonce] / 100
+            if results is not None
+            else
+            dice_result(server_seed, client_seed, nonce)
+        )
+        payout_multiplier = (
+            dice_payout_multiplier(chance)
+            if dice_win(result, target, condition)
+            else
+            0.0
+        )
+
+        bet_info = BetInfo(
+            payout_multiplier=payout_multiplier,
+            payout=amount * payout_multiplier,
+            amount=amount,
+            currency=modifiers.currency,
+            game=Game.DICE,
+            state=DiceState(
+                target=target,
+                result=result,
+                dice_target_condition=condition
+            )
+        )
+
+        for rule in rules:
+            rule(bet_info, modifiers)
+
+        balance     += bet_info.payout - amount
+        bets        += 1
+        peak_bet     = max(peak_bet, amount)
+        peak_balance = max(peak_balance, balance)
+        max_drawdown = max(max_drawdown, peak_balance - balance)
+
+    return balance, bets, max_drawdown, peak_bet
+
+def _run_sessions(
+    name: str,
+    n_sessions: int,
+    start: int,
+    stop: int,
+    modifiers: DiceModifiers,
+    rules: list,
+    balance: float,
+    seed: str,
+    client_seed: str,
+    max_bets: int
+) -> None:
+    results = SessionResults(n_sessions, name=name)
+    try:
+        for index in range(start, stop):
+            results.write(
+                index,
+                *simulate_session(
+                    modifiers,
+                    rules,
+                    balance,
+                    session_seed(seed, index),
+                    client_seed,
+                    max_bets
+                )
+            )
+    finally:
+        results.close()
+
+def simulate(
+    modifiers: DiceModifiers,
+    rules: list,
+    balance: float,
+    n_sessions: int,
+    max_bets: Optional[int]=10_000,
+    seed: Optional[str]='',
+    client_seed: Optional[str]='',
+    processes: Optional[int | None]=None,
+    chunk_size: Optional[int]=1_000
+) -> SessionResults:
+    results = SessionResults(n_sessions)
+    try:
+        with Pool(processes) as pool:
+            pool.starmap(
+                _run_sessions,
+                [
+                    (
+                        results.name,
+                        n_sessions,
+                        start,
+                        min(start + chunk_size, n_sessions),
+                        modifiers,
+                        rules,
+                        balance,
+                        seed,
+                        client_seed,
+                        max_bets
+                    )
+                    for start in range(0, n_sessions, chunk_size)
+                ]
+            )
+    except BaseException:
+        results.close()
+        raise
+    return results
@@ -1,5 +1,9 @@
 import os
+import copy
+import dataclasses
 import time
+import threading
+import contextlib
 
 from rich import print
 from rich.text import Text
@@ -14,11 +18,15 @@ from typing import (
 )
 
 from .client import Client
+from .history import RecentBets
+from .balances import BalanceCache
+from .events import Event, EventBus
 from .models import (
     Var,
     Currency,
     DiceModifiers,
     BetInfo,
+    Statistics,
     DiceTargetCondition
 )
 from .errors import (
@@ -89,11 +97,14 @@ class EveryStreakOf:
     def __init__(
         self: Self,
         n_times: int,
-        var: Var
+        var: Var,
+        recent_bets: Optional[RecentBets | None]=None
     ) -> None:
         self._n_times        = n_times
+        self._var            = var
         self._count          = 0
         self._previous_state = None
+        self._recent_bets    = recent_bets
         self.repr            = f'EVERY_STREAK_OF_{n_times}_{var.name}'
 
         match var:
@@ -108,6 +119,9 @@ class EveryStreakOf:
         self: Self,
         bet_info: BetInfo
     ) -> bool:
+        if self._recent_bets is not None:
+            return self._read_streak()
+
         self._counter_fn(bet_info)
 
         if self._count == self._n_times:
@@ -115,6 +129,18 @@ class EveryStreakOf:
             return True
         return False
 
+    def _read_streak(self: Self) -> bool:
+        # Same firing points as the counters (every n-th bet of a run),
+        # read from the strategy's RecentBets instead of tracked here.
+        recent_bets = self._recent_bets
+        match self._var:
+            case Var.BETS:
+                return recent_bets.count % self._n_times == 0
+            case Var.WINS:
+                return recent_bets.streak_win is True and recent_bets.streak % self._n_times == 0
+            case Var.LOSSES:
+                return recent_bets.streak_win is False and recent_bets.streak % self._n_times == 0
+
     def _bets_counter(
         self: Self,
         bet_info: BetInfo
@@ -209,10 +235,16 @@ class Rule:
     def __call__(self, bet_info, modifiers):
         if self._on(bet_info):
             self._do(modifiers)
+            return True
+        return False
 
 class Strategy:
-    def __init__(self, client, modifiers=None, rules=None):
+    def __init__(self, client, modifiers=None, rules=None, events=None, balances=None):
         self._client    = client
+        # Without a shared cache the strategy polls its own, started by run().
+        self._owns_balances = balances is None
+        self._balances  = BalanceCache(client) if balances is None else balances
+        self.events     = EventBus() if events is None else events
         self.rules     = [] if rules is None else rules
         self.modifiers = (
             modifiers
@@ -235,13 +267,10 @@ class Strategy:
             profit=0,
             wagered=0
         )
-        self.bet_table  = Table(
-            Column('No'),
-            Column('Bet Id'),
-            Column('Payout Multiplier'),
-            Column('Amount'),
-            Column('Payout')
-        )
+        self.recent_bets = RecentBets(10)
+        self.events.subscribe(Event.BET_SETTLED, self._update_statistics)
+        self.events.subscribe(Event.BALANCE_RECONCILED, self._update_balance)
+        self._balances.events.subscribe(Event.BALANCE_RECONCILED, self._reconcile_balance)
 
     def generate_stats_panel(self):
         balance = Text(f'BALANCE  : {self.statistics.balance:.8f}\n')
@@ -281,69 +310,146 @@ class Strategy:
         )
 
     def get_available_balance(self):
-        return [
-            balance.available.amount
-            for balance in self._client.get_user_balances()
-            if balance.available.currency == self.modifiers.currency
-        ][0]
+        return self._balances.available(self.modifiers.currency)
+
+    def _reconcile_balance(self, balances):
+        # Runs on the BalanceCache poller, off the bet path.
+        if self.modifiers.currency in balances:
+            self.events.emit(
+                Event.BALANCE_RECONCILED,
+                balances[self.modifiers.currency].available.amount
+            )
 
-    def run(self, rules=None):
+    def _update_balance(self, balance):
+        self.statistics.balance = balance
+
+    def _update_statistics(self, bet_info):
+        # Tracked locally between polls, BALANCE_RECONCILED corrects it.
+        self.statistics.balance += bet_info.payout - bet_info.amount
+        self.statistics.profit  += bet_info.payout - bet_info.amount
+        self.statistics.wagered += bet_info.amount
+        self.statistics.bets    += 1
+        if bet_info.win:
+            self.statistics.wins   += 1
+        else:
+            self.statistics.losses += 1
+
+    def generate_bet_table(self):
+        bet_table = Table(
+            Column('No'),
+            Column('Bet Id'),
+            Column('Payout Multiplier'),
+            Column('Amount'),
+            Column('Payout')
+        )
+        for number, bet_id, payout_multiplier, amount, payout, win in self.recent_bets.rows():
+            style = 'green' if win else 'red'
+            bet_table.add_row(
+                Text(str(number), style=style),
+                Text(bet_id, style=style),
+                Text(str(payout_multiplier), style=style),
+                Text(f'{amount:.8f}', style=style),
+                Text(f'{payout:.8f}', style=style),
+            )
+        return bet_table
+
+    def step(self):
+        # Rules mutate self.modifiers after the bet, listeners get a copy.
+        # Only built when someone listens.
+        if self.events.has_listeners(Event.BET_SUBMITTED):
+            self.events.emit(Event.BET_SUBMITTED, dataclasses.replace(self.modifiers))
+        try:
+            bet_info = self._client.dice_roll(
+                amount=self.modifiers.bet_amount,
+                currency=self.modifiers.currency,
+                chance=self.modifiers.chance,
+                dice_target_condition=self.modifiers.dice_target_condition
+            )
+        except Exception as error:
+            self.events.emit(Event.ERROR, error)
+            raise
+
+        # Filled before the rules so conditions built on recent_bets see
+        # the bet they are judging.
+        self.recent_bets.append(bet_info)
+        rule_fired = self.events.has_listeners(Event.RULE_FIRED)
+        for rule in self.rules:
+            if rule(bet_info, self.modifiers) and rule_fired:
+                self.events.emit(Event.RULE_FIRED, rule)
+
+        self.events.emit(Event.BET_SETTLED, bet_info)
+        return bet_info
+
+    def generate_renderable(self):
+        return Group(
+            self.generate_stats_panel(),
+            self.generate_bet_table()
+        )
+
+    def run(self, rules=None, refresh_per_second=4):
         if rules:
             self.rules = rules
 
-        with Live(
-            Group(
-                self.generate_stats_panel(),
-                self.bet_table
+        # Live redraws from its own thread and the BalanceCache polls from
+        # another, so neither sits between two bets.
+        with (
+            self._balances if self._owns_balances else contextlib.nullcontext(),
+            Live(
+                get_renderable=self.generate_renderable,
+                refresh_per_second=refresh_per_second
             )
-        ) as live:
+        ):
             while True:
-                bet_info = self._client.dice_roll(
-                    amount=self.modifiers.bet_amount,
-                    currency=self.modifiers.currency,
-                    chance=self.modifiers.chance,
-                    dice_target_condition=self.modifiers.dice_target_condition
-                )
+                self.step()
+
+class MultiCurrencyStrategy:
+    def __init__(self, client, modifiers, rules=None, interval=1.0):
+        # One Strategy per currency, all reading the same BalanceCache so a
+        # single UserBalances poll serves every session.
+        self.balances   = BalanceCache(client, interval)
+        self.strategies = [
+            Strategy(
+                client,
+                currency_modifiers,
+                copy.deepcopy(rules),
+                balances=self.balances
+            )
+            for currency_modifiers in modifiers
+        ]
+        self._interval  = interval
+        self._errors    = {}
 
-                for rule in self.rules:
-                    rule(bet_info, self.modifiers)
-
-                bet_id            = bet_info.id
-                payout_multiplier = bet_info.payout_multiplier
-                amount            = bet_info.amount
-                payout            = bet_info.payout
-
-                self.statistics.balance  = self.get_available_balance()
-                self.statistics.profit  += payout - amount
-                self.statistics.wagered += amount
-                self.statistics.bets    += 1
-                if bet_info.win:
-                    self.bet_table.add_row(
-                        Text(str(self.statistics.bets), style='green'),
-                        Text(bet_id, style='green'),
-                        Text(str(payout_multiplier), style='green'),
-                        Text(f'{amount:.8f}', style='green'),
-                        Text(f'{payout:.8f}', style='green'),
-                    )
-                    self.statistics.wins += 1
-                else:
-                    self.bet_table.add_row(
-                        Text(str(self.statistics.bets), style='red'),
-                        Text(bet_id, style='red'),
-                        Text(str(payout_multiplier), style='red'),
-                        Text(f'{amount:.8f}', style='red'),
-                        Text(f'{payout:.8f}', style='red'),
-                    )
-                    self.statistics.losses += 1
-
-                for column in self.bet_table.columns:
-                    if len(column._cells) > 10:
-                        column._cells.pop(0)
-
-                live.update(
-                    Group(
-                        self.generate_stats_panel(),
-                        self.bet_table
-                    ),
-                    refresh=True
-                )
\ No newline at end of file
+    def _run_strategy(self, strategy):
+        try:
+            while True:
+                strategy.step()
+        except Exception as error:
+            self._errors[strategy.modifiers.currency] = error
+
+    def generate_panels(self):
+        return Group(*(
+            Panel(
+                strategy.generate_stats_panel().renderable,
+                title=(
+                    f'{strategy.modifiers.currency.name} (stopped: {self._errors[strategy.modifiers.currency]!r})'
+                    if strategy.modifiers.currency in self._errors
+                    else
+                    strategy.modifiers.currency.name
+                )
+            )
+            for strategy in self.strategies
+        ))
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self._run_strategy, args=(strategy,), daemon=True)
+            for strategy in self.strategies
+        ]
+
+        with self.balances, Live(self.generate_panels()) as live:
+            for thread in threads:
+                thread.start()
+
+            while any(thread.is_alive() for thread in threads):
+                time.sleep(self._interval)
+                live.update(self.generate_panels(), refresh=True)
@@ -0,0 +1,180 @@
+import os
+import mmap
+import hashlib
+import tempfile
+
+from array import array
+from collections import OrderedDict
+from typing import (
+    Self,
+    Optional
+)
+
+from .fair import (
+    dice_result,
+    limbo_result
+)
+from .models import Game
+
+# Both games settle on two decimals, so results are stored as integer
+# hundredths: exact, unlike float32, which reads 1.01 back as 1.00999999.
+# Dice fits a uint16. Limbo uses a uint32 and saturates above
+# 42,949,672.95x, which still beats every multiplier_target below that.
+TYPECODES = {
+    Game.DICE : 'H',
+    Game.LIMBO: 'I'
+}
+
+LIMBO_MAX_HUNDREDTHS = 2 ** 32 - 1
+
+def _dice_hundredths(
+    server_seed: str,
+    client_seed: str,
+    nonce: int
+) -> int:
+    return round(dice_result(server_seed, client_seed, nonce) * 100)
+
+def _limbo_hundredths(
+    server_seed: str,
+    client_seed: str,
+    nonce: int
+) -> int:
+    return min(round(limbo_result(server_seed, client_seed, nonce) * 100), LIMBO_MAX_HUNDREDTHS)
+
+GENERATORS = {
+    Game.DICE : _dice_hundredths,
+    Game.LIMBO: _limbo_hundredths
+}
+
+class SeedStreamCache:
+    def __init__(
+        self: Self,
+        directory: Optional[str | None]=None,
+        max_bytes: Optional[int]=1 << 30,
+        max_open: Optional[int]=16
+    ) -> None:
+        self.directory = (
+            directory
+            if directory
+            else
+            os.path.join(tempfile.gettempdir(), 'stakepy-streams')
+        )
+        self.max_bytes = max_bytes
+        self.max_open  = max_open
+        self._open     = OrderedDict()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(
+        self: Self,
+        game: Game,
+        server_seed: str,
+        client_seed: str,
+        start: int,
+        stop: int
+    ) -> str:
+        key = hashlib.sha256(
+            f'{game}:{TYPECODES[game]}:{server_seed}:{client_seed}:{start}:{stop}'.encode()
+        ).hexdigest()
+        return os.path.join(self.directory, f'{game}-{key}.bin')
+
+    def _generate(
+        self: Self,
+        path: str,
+        game: Game,
+        server_seed: str,
+        client_seed: str,
+        start: int,
+        stop: int
+    ) -> None:
+        generator = GENERATORS[game]
+        results   = array(
+            TYPECODES[game],
+            (
+                generator(server_seed, client_seed, nonce)
+                for nonce in range(start, stop)
+            )
+        )
+        # Write then rename so a concurrent reader never maps a partial file.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as file_handler:
+            results.tofile(file_handler)
+        os.replace(tmp_path, path)
+        self._evict(keep=path)
+
+    def _evict(
+        self: Self,
+        keep: str
+    ) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.bin'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._open.pop(path, None)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def get(
+        self: Self,
+        game: Game,
+        server_seed: str,
+        client_seed: str,
+        start: int,
+        stop: int
+    ) -> memoryview:
+        if stop <= start:
+            return memoryview(b'').cast(TYPECODES[game])
+
+        path = self._path(game, server_seed, client_seed, start, stop)
+        if path in self._open:
+            self._open.move_to_end(path)
+            # Another process may have evicted the file, the mapping stays valid.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return self._open[path]
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._generate(path, game, server_seed, client_seed, start, stop)
+
+        with open(path, 'rb') as file_handler:
+            view = memoryview(
+                mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ)
+            ).cast(TYPECODES[game])
+
+        self._open[path] = view
+        if len(self._open) > self.max_open:
+            # Views handed out earlier keep their mmap alive until released.
+            self._open.popitem(last=False)
+        return view
+
+    def dice(
+        self: Self,
+        server_seed: str,
+        client_seed: str,
+        start: int,
+        stop: int
+    ) -> memoryview:
+        return self.get(Game.DICE, server_seed, client_seed, start, stop)
+
+    def limbo(
+        self: Self,
+        server_seed: str,
+        client_seed: str,
+        start: int,
+        stop: int
+    ) -> memoryview:
+        return self.get(Game.LIMBO, server_seed, client_seed, start, stop)
@@ -0,0 +1,277 @@
+import re
+import json
+import time
+import uuid
+import random
+import socket
+import struct
+import secrets
+import threading
+
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from typing import (
+    Self,
+    Optional
+)
+
+from .fair import (
+    dice_result,
+    limbo_result,
+    dice_win,
+    dice_payout_multiplier
+)
+from .models import (
+    Game,
+    Currency,
+    DiceTargetCondition
+)
+
+OPERATION_PATTERN = re.compile(r'(?:query|mutation)\s+(\w+)')
+
+# Injectable faults. The first two are returned as GraphQL errors the
+# same way the real API does, the rest break the transport.
+ERROR_TYPES = (
+    'insufficientBalance',
+    'insignificantBet',
+    'malformed',
+    'reset'
+)
+
+@dataclass
+class StubConfig:
+    latency    : float=0.0
+    jitter     : float=0.0
+    error_rates: dict[str, float]=field(default_factory=dict)
+    rate_limit : Optional[float | None]=None
+    balance    : float=1000.0
+    min_bet    : float=0.0
+    server_seed: str=field(default_factory=lambda: secrets.token_hex(32))
+    client_seed: str=field(default_factory=lambda: secrets.token_hex(8))
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes on a kept-alive socket,
+    # with Nagle on the body waits for the client's delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        server  = self.server
+        payload = self.rfile.read(int(self.headers.get('content-length', 0)))
+        delay   = server.config.latency + random.uniform(-server.config.jitter, server.config.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if not server.acquire_token():
+            self._send(429, b'Too Many Requests', 'text/plain')
+            return
+
+        match server.pick_fault():
+            case 'reset':
+                # Linger 0 makes close() send RST instead of FIN.
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET,
+                    socket.SO_LINGER,
+                    struct.pack('ii', 1, 0)
+                )
+                self.close_connection = True
+                return
+            case 'malformed':
+                self._send(200, b'{"data": {', 'application/json')
+                return
+            case 'insufficientBalance' | 'insignificantBet' as error_type:
+                body = server.error(error_type, 'Injected error.')
+            case _:
+                body = server.handle_graphql(json.loads(payload))
+
+        self._send(200, json.dumps(body).encode(), 'application/json')
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('content-type', content_type)
+        self.send_header('content-length', str(len(body)))
+        if status == 429:
+            self.send_header('retry-after', '1')
+        self.end_headers()
+        self.wfile.write(body)
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self: Self,
+        address: Optional[tuple[str, int]]=('127.0.0.1', 0),
+        config: Optional[StubConfig | None]=None
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.config    = StubConfig() if config is None else config
+        self.nonce     = 0
+        self.user      = dict(id=str(uuid.uuid4()), name='stub')
+        self.balances  = {
+            currency: self.config.balance
+            for currency in Currency
+        }
+        self._lock     = threading.Lock()
+        self._tokens   = max(self.config.rate_limit or 0.0, 1.0)
+        self._last     = time.monotonic()
+        self._thread   = None
+
+    @property
+    def url(self: Self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/_api/graphql'
+
+    def start(self: Self) -> Self:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self: Self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self: Self) -> Self:
+        return self.start()
+
+    def __exit__(self: Self, *exc_info) -> None:
+        self.stop()
+
+    def acquire_token(self: Self) -> bool:
+        rate_limit = self.config.rate_limit
+        if rate_limit is None:
+            return True
+
+        with self._lock:
+            # Below 1 rps the bucket must still be able to hold one token.
+            now          = time.monotonic()
+            self._tokens = min(max(rate_limit, 1.0), self._tokens + (now - self._last) * rate_limit)
+            self._last   = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def pick_fault(self: Self) -> str | None:
+        roll = random.random()
+        for error_type, rate in self.config.error_rates.items():
+            if roll < rate:
+                return error_type
+            roll -= rate
+        return None
+
+    def error(
+        self: Self,
+        error_type: str,
+        message: str
+    ) -> dict:
+        return {
+            'data': None,
+            'errors': [
+                {
+                    'errorType': error_type,
+                    'message': message
+                }
+            ]
+        }
+
+    def handle_graphql(
+        self: Self,
+        payload: dict
+    ) -> dict:
+        variables = payload.get('variables') or {}
+        operation = OPERATION_PATTERN.search(payload.get('query', ''))
+        match operation and operation[1]:
+            case 'UserBalances':
+                return self._user_balances()
+            case 'DiceRoll':
+                return self._bet(Game.DICE, variables)
+            case 'LimboBet':
+                return self._bet(Game.LIMBO, variables)
+            case _:
+                return self.error('badRequest', 'Unknown operation.')
+
+    def _user_balances(self: Self) -> dict:
+        with self._lock:
+            balances = [
+                {
+                    'available': {
+                        'amount': amount,
+                        'currency': currency.value,
+                        '__typename': 'Balance'
+                    },
+                    'vault': {
+                        'amount': 0.0,
+                        'currency': currency.value,
+                        '__typename': 'Balance'
+                    },
+                    '__typename': 'UserBalance'
+                }
+                for currency, amount in self.balances.items()
+            ]
+        return {'data': {'user': {'id': self.user['id'], 'balances': balances, '__typename': 'User'}}}
+
+    def _bet(
+        self: Self,
+        game: Game,
+        variables: dict
+    ) -> dict:
+        amount   = float(variables['amount'])
+        currency = Currency(variables['currency'])
+
+        if amount < self.config.min_bet or amount < 0:
+            return self.error('insignificantBet', 'Bet amount is too small.')
+
+        with self._lock:
+            if amount > self.balances[currency]:
+                return self.error('insufficientBalance', 'Insufficient balance.')
+            nonce       = self.nonce
+            self.nonce += 1
+
+            match game:
+                case Game.DICE:
+                    target    = float(variables['target'])
+                    condition = DiceTargetCondition(variables['condition'])
+                    chance    = target if condition == DiceTargetCondition.BELOW else 100 - target
+                    result    = dice_result(self.config.server_seed, self.config.client_seed, nonce)
+                    payout_multiplier = (
+                        dice_payout_multiplier(chance)
+                        if dice_win(result, target, condition)
+                        else
+                        0.0
+                    )
+                    operation = 'diceRoll'
+                    state     = dict(result=result, target=target, condition=condition.value)
+                case Game.LIMBO:
+                    multiplier_target = float(variables['multiplierTarget'])
+                    result    = limbo_result(self.config.server_seed, self.config.client_seed, nonce)
+                    payout_multiplier = multiplier_target if result >= multiplier_target else 0.0
+                    operation = 'limboBet'
+                    state     = dict(result=result, multiplierTarget=multiplier_target)
+
+            payout                  = amount * payout_multiplier
+            self.balances[currency] += payout - amount
+
+        return {
+            'data': {
+                operation: {
+                    'id': str(uuid.uuid4()),
+                    'active': False,
+                    'payoutMultiplier': payout_multiplier,
+                    'amountMultiplier': 1,
+                    'amount': amount,
+                    'payout': payout,
+                    'updatedAt': datetime.now(timezone.utc).strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                    'currency': currency.value,
+                    'game': game.value,
+                    'user': self.user,
+                    'state': state
+                }
+            }
+        }
@@ -0,0 +1,115 @@
+import sys
+import json
+import argparse
+
+from datetime import datetime, timezone
+from rich import print
+from rich.table import Table, Column
+
+from StakePy.analytics import analyze
+
+def summary_table(title, key_name, summaries):
+    table = Table(
+        Column(key_name),
+        Column('Bets'),
+        Column('Win Rate'),
+        Column('Expected'),
+        Column('Wagered'),
+        Column('Profit'),
+        Column('RTP'),
+        title=title
+    )
+    for key, summary in sorted(summaries.items()):
+        table.add_row(
+            ' / '.join(key) if isinstance(key, tuple) else key or '-',
+            str(summary.bets),
+            f'{summary.win_rate:.4%}',
+            f'{summary.expected_win_rate:.4%}',
+            f'{summary.wagered:.8f}',
+            f'{summary.profit:.8f}',
+            f'{summary.rtp:.4%}'
+        )
+    return table
+
+def streak_table(report):
+    table = Table(
+        Column('Session'),
+        Column('Longest Win Streak'),
+        Column('Longest Loss Streak'),
+        Column('Loss Streaks >= 5'),
+        title='Streaks'
+    )
+    for session, streaks in sorted(report.streaks.items()):
+        distribution = streaks.distribution()
+        table.add_row(
+            session or '-',
+            str(max((length for win, length in distribution if win), default=0)),
+            str(max((length for win, length in distribution if not win), default=0)),
+            str(sum(count for (win, length), count in distribution.items() if not win and length >= 5))
+        )
+    return table
+
+def throughput_table(report, bucket_seconds):
+    table = Table(
+        Column('Bucket'),
+        Column('Bets'),
+        Column('Bets/s'),
+        title='Throughput'
+    )
+    for bucket, bets in sorted(report.throughput.items()):
+        table.add_row(
+            datetime.fromtimestamp(bucket, timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+            str(bets),
+            f'{bets / bucket_seconds:.2f}'
+        )
+    return table
+
+def to_json(report):
+    return {
+        'sessions': {key: vars(value) for key, value in report.sessions.items()},
+        'rule_sets': {key: vars(value) for key, value in report.rule_sets.items()},
+        'rtp': {'/'.join(key): vars(value) for key, value in report.rtp.items()},
+        'streaks': {
+            key: {
+                f'{"win" if win else "loss"}_{length}': count
+                for (win, length), count in value.distribution().items()
+            }
+            for key, value in report.streaks.items()
+        },
+        'profit_curves': {key: report.profit_curve(key) for key in report.profit},
+        'throughput': dict(sorted(report.throughput.items()))
+    }
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='analytics',
+        description='Summarize `StakePy Bot` bet histories (CSV exports or JSON-lines journals)'
+    )
+
+    parser.add_argument('filename')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--chunk-mb', type=int, default=64)
+    parser.add_argument('--bucket', type=int, default=60, help='seconds per time bucket')
+    parser.add_argument('--json', action='store_true', help='print the full report as JSON')
+    args = parser.parse_args()
+
+    report = analyze(
+        args.filename,
+        processes=args.processes,
+        chunk_bytes=args.chunk_mb << 20,
+        bucket_seconds=args.bucket
+    )
+
+    if args.json:
+        # Not rich.print, it wraps long lines at the console width.
+        sys.stdout.write(json.dumps(to_json(report)) + '\n')
+        return
+
+    print(summary_table('Sessions', 'Session', report.sessions))
+    print(summary_table('Rule Sets', 'Rule Set', report.rule_sets))
+    print(summary_table('RTP by Game/Currency', 'Game / Currency', report.rtp))
+    print(streak_table(report))
+    print(throughput_table(report, args.bucket))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import argparse
+
+from StakePy.stub import StubServer, StubConfig, ERROR_TYPES
+
+def parse_error_rate(value):
+    error_type, rate = value.split('=')
+    if error_type not in ERROR_TYPES:
+        raise argparse.ArgumentTypeError(f'unknown error type {error_type!r}, choose from {", ".join(ERROR_TYPES)}')
+    return error_type, float(rate)
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='stub_server',
+        description='Serve a local Stake.com GraphQL stub for load and soak testing `StakePy Bot`'
+    )
+
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='seconds of uniform jitter around --latency')
+    parser.add_argument('--error', type=parse_error_rate, action='append', default=[], metavar='TYPE=RATE')
+    parser.add_argument('--rate-limit', type=float, default=None, help='requests per second before answering 429')
+    parser.add_argument('--balance', type=float, default=1000.0)
+    parser.add_argument('--min-bet', type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rates=dict(args.error),
+        rate_limit=args.rate_limit,
+        balance=args.balance,
+        min_bet=args.min_bet
+    )
+    server = StubServer((args.host, args.port), config)
+    print(f'STAKE_API_URL={server.url}')
+    print(f'server_seed={config.server_seed}\nclient_seed={config.client_seed}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()